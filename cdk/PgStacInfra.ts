@@ -50,6 +50,9 @@ export class PgStacInfra extends Stack {
         NAME: `MAAP STAC API (${stage})`,
         VERSION: version,
         DESCRIPTION: "STAC API for the MAAP STAC system.",
+        // one connection per Lambda instance, concurrency comes from scaling out
+        DB_MIN_CONN_SIZE: "1",
+        DB_MAX_CONN_SIZE: "1",
       },
       vpc,
       db,
@@ -78,6 +81,8 @@ export class PgStacInfra extends Stack {
         NAME: `MAAP titiler pgstac API (${stage})`,
         VERSION: version,
         DESCRIPTION: "titiler pgstac API for the MAAP STAC system.",
+        DB_MIN_CONN_SIZE: "1",
+        DB_MAX_CONN_SIZE: "1",
       },
       vpc,
       db,
@@ -2,25 +2,25 @@ import pytest
 from ingestion import StacIngestion
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def stac_ingestion_instance():
     return StacIngestion()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def authentication_token(stac_ingestion_instance):
     return stac_ingestion_instance.get_authentication_token()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_collection(stac_ingestion_instance):
     return stac_ingestion_instance.get_test_collection()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_item(stac_ingestion_instance):
     return stac_ingestion_instance.get_test_item()
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_titiler_search_request(stac_ingestion_instance):
     return stac_ingestion_instance.get_test_titiler_search_request()
\ No newline at end of file
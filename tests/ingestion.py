@@ -24,6 +24,9 @@ class StacIngestion:
         self.collections_endpoint = "/collections"
         self.items_endpoint = "/ingestions"
         self.current_file_path = os.path.dirname(os.path.abspath(__file__))
+        # Reuse one HTTP session so requests to the same API share pooled
+        # keep-alive connections instead of a new TLS handshake per call.
+        self.session = requests.Session()
 
     def validate_collection(self, collection):
         try:
@@ -59,7 +62,7 @@ class StacIngestion:
         cognito_domain = secret["cognito_domain"]
         scope = secret["scope"]
 
-        res_token = requests.post(
+        res_token = self.session.post(
             f"{cognito_domain}/oauth2/token",
             headers={
                 "Content-Type": "application/x-www-form-urlencoded",
@@ -77,7 +80,7 @@ class StacIngestion:
 
     def insert_collection(self, token, collection):
         headers = {"Authorization": f"bearer {token}"}
-        response = requests.post(
+        response = self.session.post(
             self.ingestor_url + self.collections_endpoint,
             json=collection,
             headers=headers,
@@ -86,32 +89,32 @@ class StacIngestion:
 
     def insert_item(self, token, item):
         headers = {"Authorization": f"bearer {token}"}
-        response = requests.post(
+        response = self.session.post(
             self.ingestor_url + self.items_endpoint, json=item, headers=headers
         )
         return response
 
     def query_collection(self, collection_id):
-        response = requests.get(
+        response = self.session.get(
             self.stac_url + self.collections_endpoint + f"/{collection_id}"
         )
         return response
 
     def query_items(self, collection_id):
-        response = requests.get(
+        response = self.session.get(
             self.stac_url + self.collections_endpoint + f"/{collection_id}/items"
         )
         return response
 
     def register_mosaic(self, search_request):
-        response = requests.post(
+        response = self.session.post(
             self.titiler_pgstac_url + "/mosaic/register", json=search_request
         )
         return response
 
     def list_mosaic_assets(self, search_id):
         """list the assets of the first tile"""
-        response = requests.get(
+        response = self.session.get(
             self.titiler_pgstac_url + f"/mosaic/{search_id}/tiles/0/0/0/assets"
         )
         return response
@@ -143,7 +146,7 @@ class StacIngestion:
 
     def delete_collection(self, token, collection_id):
         headers = {"Authorization": f"bearer {token}"}
-        response = requests.delete(
+        response = self.session.delete(
             self.ingestor_url + self.collections_endpoint + f"/{collection_id}",
             headers=headers,
         )